@@ -50,6 +50,21 @@ from .sanitizer import sanitize_email_body, is_noreply_address, extract_sender_d
 
 logger = logging.getLogger(__name__)
 
+# Receipt keyword scan, precompiled once: one linear pass over the subject
+# instead of a substring search per keyword.
+_RE_RECEIPT_KEYWORDS = re.compile(r"receipt|order confirmation|purchase|invoice")
+
+# Deterministic domain routing for known business senders. Extending this dict
+# is the supported way to add new domain routes.
+_BUSINESS_DOMAIN_ROUTES = {
+    "em.delhaize.be": {
+        "category": "Business",
+        "sub_category": "Delhaize",
+        "analysis": "Email from Delhaize marketing domain",
+        "sender_goal": "Promote Delhaize offers",
+    },
+}
+
 
 class EmailCategorizer:
     """
@@ -73,6 +88,17 @@ class EmailCategorizer:
         self.settings = settings
         self.client = Groq(api_key=settings.groq_api_key)
 
+        # Heuristic lookups run once per email, so hoist the list scan and
+        # repeated lowercasing into per-instance structures.
+        self._collaborator_emails = frozenset(settings.collaborator_email_list)
+        self._boss_email = (settings.boss_email or "").lower()
+        self._company_domain = (settings.company_domain or "").lower()
+
+        # Memoized system prompt; its inputs (settings, template file) are
+        # fixed for the lifetime of the instance. Built lazily so tests can
+        # still stub the template loader before first use.
+        self._system_prompt: Optional[str] = None
+
     def _load_system_prompt_template(self) -> str:
         """Load the system prompt template from disk.
 
@@ -162,6 +188,19 @@ class EmailCategorizer:
                 No additional text or tokens outside the JSON.
                 """
 
+    def _get_system_prompt(self) -> str:
+        """Return the system prompt, building it on first use.
+
+        The prompt depends only on settings and the on-disk template, so over
+        a batch of N emails this turns N file reads + renders into one.
+
+        Returns:
+            str: System prompt with categorization rules.
+        """
+        if self._system_prompt is None:
+            self._system_prompt = self._build_system_prompt()
+        return self._system_prompt
+
     def _build_user_prompt(self, email: Email, sanitized_body: str) -> str:
         """
         Build user prompt with email data.
@@ -389,8 +428,8 @@ Return a single JSON object only (no Markdown fences).
             logger.info(f"Quick categorization for '{email.subject}': {quick_result.category}")
             return quick_result'''
 
-        # Build prompts
-        system_prompt = self._build_system_prompt()
+        # Build prompts (system prompt is memoized across the batch)
+        system_prompt = self._get_system_prompt()
         user_prompt = self._build_user_prompt(email, sanitized_body)
 
         try:
@@ -481,30 +520,26 @@ Return a single JSON object only (no Markdown fences).
             )
 
         # Domain-based business routing
-        if sender_domain == "em.delhaize.be":
+        route = _BUSINESS_DOMAIN_ROUTES.get(sender_domain) if sender_domain else None
+        if route:
             return CategorizationResult(
                 id=email.id,
                 subject=email.subject,
-                category="Business",
-                sub_category="Delhaize",
-                analysis="Email from Delhaize marketing domain",
-                sender_goal="Promote Delhaize offers",
+                **route,
             )
 
         # Check for boss
-        if self.settings.boss_email:
-            boss_email_lower = self.settings.boss_email.lower()
-            if sender == boss_email_lower or from_addr == boss_email_lower:
-                return CategorizationResult(
-                    id=email.id,
-                    subject=email.subject,
-                    category="Boss",
-                    analysis="Email from boss",
-                    sender_goal="Request your attention",
-                )
+        if self._boss_email and (sender == self._boss_email or from_addr == self._boss_email):
+            return CategorizationResult(
+                id=email.id,
+                subject=email.subject,
+                category="Boss",
+                analysis="Email from boss",
+                sender_goal="Request your attention",
+            )
 
         # Check for collaborators
-        if sender in self.settings.collaborator_email_list:
+        if sender in self._collaborator_emails:
             return CategorizationResult(
                 id=email.id,
                 subject=email.subject,
@@ -514,22 +549,19 @@ Return a single JSON object only (no Markdown fences).
             )
 
         # Check for company domain
-        if self.settings.company_domain:
-            domain = self.settings.company_domain.lower()
-            if sender_domain and domain in sender_domain:
-                return CategorizationResult(
-                    id=email.id,
-                    subject=email.subject,
-                    category="Company",
-                    analysis=f"Email from company domain ({domain})",
-                    sender_goal="Provide a company update",
-                )
+        if self._company_domain and sender_domain and self._company_domain in sender_domain:
+            return CategorizationResult(
+                id=email.id,
+                subject=email.subject,
+                category="Company",
+                analysis=f"Email from company domain ({self._company_domain})",
+                sender_goal="Provide a company update",
+            )
 
         # Check for obvious spam/junk indicators
         if is_noreply_address(sender) or is_noreply_address(from_addr):
             # Check for receipt keywords
-            receipt_keywords = ["receipt", "order confirmation", "purchase", "invoice"]
-            if any(kw in subject_lower for kw in receipt_keywords):
+            if _RE_RECEIPT_KEYWORDS.search(subject_lower):
                 return CategorizationResult(
                     id=email.id,
                     subject=email.subject,
@@ -25,6 +25,7 @@ Operational notes:
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 import logging
 
@@ -180,6 +181,12 @@ class Settings(BaseSettings):
     email_batch_size: int = Field(
         default=10, ge=1, le=50, description="Emails per batch"
     )
+    max_concurrent_runs: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum categorizer runs the webapp executes concurrently",
+    )
     log_level: str = Field(default="INFO", description="Logging level")
 
     @property
@@ -233,6 +240,7 @@ class Settings(BaseSettings):
         return [cat.value for cat in EmailCategory]
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Load and return application settings.
@@ -241,6 +249,11 @@ def get_settings() -> Settings:
     construct a :class:`Settings` instance directly or pass a mocked settings
     object.
 
+    The result is cached: settings come from the environment, which does not
+    change for the lifetime of the process, so repeat callers share one
+    instance instead of re-reading and re-validating the ``.env`` file.
+    (Failures are not cached; lru_cache does not memoize raised exceptions.)
+
     Returns:
         Settings: Application settings instance.
 
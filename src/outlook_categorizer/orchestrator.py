@@ -34,18 +34,32 @@ Operational notes:
     - The orchestrator does not persist state between runs.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 
 from .auth import GraphAuthenticator
 from .categorizer import EmailCategorizer
 from .config import Settings, get_settings, CATEGORIZED_TAG
 from .email_client import EmailClient
 from .folder_manager import FolderManager
-from .models import Email, ProcessingResult
+from .models import CategorizationResult, Email, Folder, ProcessingResult
 
 logger = logging.getLogger(__name__)
 
+# How long cached descendant-folder lists stay valid (seconds). Folder
+# hierarchies change rarely; a short TTL keeps request bursts cheap while
+# bounding staleness.
+_DESCENDANTS_CACHE_TTL = 300.0
+
+# Maximum concurrent Graph fetches. Outlook enforces a per-mailbox
+# concurrency cap of 4.
+_MAX_CONCURRENT_FETCHES = 4
+
 
 class EmailOrchestrator:
     """
@@ -85,6 +99,111 @@ class EmailOrchestrator:
         self.categorizer = EmailCategorizer(self.settings)
         self.folder_manager = FolderManager(self.email_client)
 
+        # Cache of descendant-folder lists keyed by folder id, with the
+        # monotonic timestamp of when each entry was computed.
+        self._descendants_cache: dict[str, tuple[float, list[Folder]]] = {}
+
+        # Per-run memo of destination folders keyed by (category,
+        # sub_category). Batches typically contain few distinct pairs, so each
+        # pair is resolved (and its folders created, if needed) only once.
+        self._destination_cache: dict[tuple[str, Optional[str]], Folder] = {}
+
+        # Per-run dedupe cache of categorization results keyed by a digest of
+        # (sender address, subject, body prefix). Newsletters and automated
+        # notifications share identical bodies, so duplicates skip the LLM
+        # round-trip entirely.
+        self._categorize_cache: dict[bytes, CategorizationResult] = {}
+
+        # A shared instance (e.g. the webapp singleton) may receive concurrent
+        # run() calls, but the folder cache and per-run memos above are not
+        # safe to rebuild while another run is mid-flight; runs serialize here.
+        self._run_lock = threading.Lock()
+
+        # Mailbox the email client is currently configured for; see
+        # :meth:`_configure_target`.
+        self._effective_target = self.settings.target_user_principal_name
+
+    def _get_destination_folder_cached(self, categorization: CategorizationResult) -> Optional[Folder]:
+        """Resolve the destination folder for a categorization, memoized.
+
+        Args:
+            categorization: Categorization result with category/subcategory.
+
+        Returns:
+            Optional[Folder]: Destination folder, or None when resolution
+            fails (failures are not cached).
+        """
+        key = (categorization.category, categorization.sub_category)
+        folder = self._destination_cache.get(key)
+        if folder is None:
+            folder = self.folder_manager.get_destination_folder(categorization)
+            if folder:
+                self._destination_cache[key] = folder
+        return folder
+
+    def _categorize_cached(self, email: Email) -> Optional[CategorizationResult]:
+        """Categorize an email, reusing results for duplicate content.
+
+        Emails with the same sender address, subject, and body prefix are
+        assumed to categorize identically, so only the first one pays the LLM
+        round-trip. The full address (not just the domain) is part of the key
+        because the heuristics route on exact addresses — boss@ and hr@ on the
+        same domain must not share a result. Newsletter and notification
+        blasts come from a single address, so the dedupe win is unchanged.
+        Cached results are copied with the current email's id and subject;
+        failed categorizations are not cached.
+
+        Args:
+            email: Email to categorize.
+
+        Returns:
+            Optional[CategorizationResult]: Categorization, or None on failure.
+        """
+        key = hashlib.blake2b(
+            "|".join(
+                (
+                    (email.sender_email or "").lower(),
+                    email.subject[:128],
+                    email.body.content[:512],
+                )
+            ).encode("utf-8", "surrogatepass"),
+            digest_size=16,
+        ).digest()
+
+        cached = self._categorize_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Categorization cache hit for email {email.id}")
+            return cached.model_copy(update={"id": email.id, "subject": email.subject})
+
+        categorization = self.categorizer.categorize(email)
+        if categorization:
+            self._categorize_cache[key] = categorization
+        return categorization
+
+    def _get_descendant_folders_cached(self, folder_id: str) -> list[Folder]:
+        """Return descendant folders for a folder id, using a TTL cache.
+
+        Repeated runs (e.g. FastAPI request bursts) reuse the previously
+        computed folder list instead of re-walking the folder hierarchy.
+
+        Args:
+            folder_id: Root folder id to start from.
+
+        Returns:
+            list[Folder]: Folders including all descendants.
+        """
+        now = time.monotonic()
+        entry = self._descendants_cache.get(folder_id)
+        if entry and now - entry[0] < _DESCENDANTS_CACHE_TTL:
+            return entry[1]
+
+        folders = self.folder_manager.get_descendant_folders(
+            folder_id,
+            include_self=True,
+        )
+        self._descendants_cache[folder_id] = (now, folders)
+        return folders
+
     def process_email(self, email: Email) -> ProcessingResult:
         """
         Process a single email: categorize and move to folder.
@@ -102,8 +221,8 @@ class EmailOrchestrator:
             ProcessingResult: Result of processing.
         """
         try:
-            # Categorize email
-            categorization = self.categorizer.categorize(email)
+            # Categorize email (duplicate bodies reuse the first result)
+            categorization = self._categorize_cached(email)
 
             if not categorization:
                 return ProcessingResult(
@@ -116,8 +235,8 @@ class EmailOrchestrator:
                     error="Failed to categorize email",
                 )
 
-            # Get destination folder
-            folder = self.folder_manager.get_destination_folder(categorization)
+            # Get destination folder (memoized per distinct category pair)
+            folder = self._get_destination_folder_cached(categorization)
 
             if not folder:
                 return ProcessingResult(
@@ -164,6 +283,36 @@ class EmailOrchestrator:
                 error=str(e),
             )
 
+    async def _process_emails_async(self, emails: list[Email]) -> list[ProcessingResult]:
+        """Process a batch of emails concurrently, preserving input order.
+
+        Each email still runs the synchronous categorize -> resolve folder ->
+        move chain, but emails are overlapped in worker threads so the LLM
+        latency of one email hides the Graph move latency of another.
+        Concurrency is capped at :data:`_MAX_CONCURRENT_FETCHES` to respect
+        the Outlook per-mailbox limit.
+
+        Args:
+            emails: Emails to process.
+
+        Returns:
+            list[ProcessingResult]: One result per email, in input order.
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+
+        async def _bounded(index: int, email: Email) -> ProcessingResult:
+            async with semaphore:
+                logger.info(
+                    f"Processing email {index}/{len(emails)}: {email.subject[:50]}..."
+                )
+                return await asyncio.to_thread(self.process_email, email)
+
+        return list(
+            await asyncio.gather(
+                *(_bounded(i, email) for i, email in enumerate(emails, 1))
+            )
+        )
+
     def run(
         self,
         limit: Optional[int] = None,
@@ -196,19 +345,189 @@ class EmailOrchestrator:
         Returns:
             list[ProcessingResult]: Results for all processed emails.
         """
+        with self._run_lock:
+            emails = self._fetch_emails(
+                limit=limit,
+                folder_id=folder_id,
+                folder_label=folder_label,
+                target_user_principal_name=target_user_principal_name,
+            )
+
+            if not emails:
+                logger.info("No emails to process")
+                return []
+
+            logger.info(f"Processing {len(emails)} emails")
+
+            if dry_run:
+                # Dry run: categorize only, sequentially (no mailbox mutation to
+                # overlap, and ordered logs are easier to inspect).
+                results = []
+                for i, email in enumerate(emails, 1):
+                    logger.info(f"Processing email {i}/{len(emails)}: {email.subject[:50]}...")
+                    results.append(self._dry_run_result(email))
+            else:
+                # Full processing: pipeline emails so categorization and move
+                # latencies overlap across the batch.
+                results = asyncio.run(self._process_emails_async(emails))
+
+            # Summary
+            successful = sum(1 for r in results if r.success)
+            failed = len(results) - successful
+
+            logger.info(f"Completed: {successful} successful, {failed} failed")
+
+            return results
+
+    def run_iter(
+        self,
+        limit: Optional[int] = None,
+        folder_id: Optional[str] = None,
+        folder_label: Optional[str] = None,
+        dry_run: bool = False,
+        target_user_principal_name: Optional[str] = None,
+    ) -> Iterator[ProcessingResult]:
+        """Run the workflow, yielding each result as soon as it is ready.
+
+        This is the streaming counterpart of :meth:`run`: emails are processed
+        sequentially and each :class:`ProcessingResult` is yielded before the
+        next email starts, so callers (e.g. the SSE endpoint) can forward
+        results incrementally instead of waiting for the whole batch.
+
+        Args:
+            limit: Maximum emails to process (uses settings default if None).
+            folder_id: Specific folder ID to process (uses settings default if None).
+            folder_label: Human-friendly folder name or path to process.
+            dry_run: If True, categorize but don't move emails.
+            target_user_principal_name: Override the target mailbox for this run.
+
+        Yields:
+            ProcessingResult: Result for each processed email, in order.
+        """
+        with self._run_lock:
+            emails = self._fetch_emails(
+                limit=limit,
+                folder_id=folder_id,
+                folder_label=folder_label,
+                target_user_principal_name=target_user_principal_name,
+            )
+
+            if not emails:
+                logger.info("No emails to process")
+                return
+
+            logger.info(f"Processing {len(emails)} emails (streaming)")
+
+            for i, email in enumerate(emails, 1):
+                logger.info(f"Processing email {i}/{len(emails)}: {email.subject[:50]}...")
+                if dry_run:
+                    yield self._dry_run_result(email)
+                else:
+                    yield self.process_email(email)
+
+    def _dry_run_result(self, email: Email) -> ProcessingResult:
+        """Categorize an email without moving it (dry-run result).
+
+        Args:
+            email: Email to categorize.
+
+        Returns:
+            ProcessingResult: Result marked as not moved.
+        """
+        categorization = self._categorize_cached(email)
+        if categorization:
+            return ProcessingResult(
+                email_id=email.id,
+                subject=email.subject,
+                sender=email.sender_email,
+                received_date_time=email.received_date_time,
+                category=categorization.category,
+                sub_category=categorization.sub_category,
+                sender_goal=categorization.sender_goal,
+                success=True,
+                error="DRY RUN - not moved",
+            )
+        return ProcessingResult(
+            email_id=email.id,
+            subject=email.subject,
+            sender=email.sender_email,
+            received_date_time=email.received_date_time,
+            category="Other",
+            success=False,
+            error="Failed to categorize",
+        )
+
+    def _configure_target(self, target_user_principal_name: Optional[str]) -> None:
+        """Point the Graph client at the mailbox for this run.
+
+        The settings object may be the process-global ``get_settings()``
+        instance, so a per-run override must never be written back to it.
+        When the requested mailbox differs from the one the client is
+        currently configured for, the client and folder manager are rebuilt
+        from a settings copy carrying the override.
+
+        Args:
+            target_user_principal_name: Override mailbox, or None to use the
+                configured default.
+        """
+        target = target_user_principal_name or self.settings.target_user_principal_name
+        if target == self._effective_target:
+            return
+
+        logger.info(f"Using per-run target_user_principal_name={target}")
+
+        run_settings = self.settings
+        if target != self.settings.target_user_principal_name:
+            run_settings = self.settings.model_copy(
+                update={"target_user_principal_name": target}
+            )
+
+        self.email_client = EmailClient(run_settings, self.auth)
+        self.folder_manager = FolderManager(self.email_client)
+        # Folder ids are mailbox-specific; drop state from the previous target.
+        self._descendants_cache.clear()
+        self._effective_target = target
+
+    def _fetch_emails(
+        self,
+        limit: Optional[int] = None,
+        folder_id: Optional[str] = None,
+        folder_label: Optional[str] = None,
+        target_user_principal_name: Optional[str] = None,
+    ) -> list[Email]:
+        """Initialize folders and fetch the batch of candidate emails.
+
+        Shared setup/fetch phase for :meth:`run` and :meth:`run_iter`.
+
+        Args:
+            limit: Maximum emails to fetch (uses settings default if None).
+            folder_id: Specific folder ID to process.
+            folder_label: Human-friendly folder name or path to process.
+            target_user_principal_name: Override the target mailbox for this run.
+
+        Returns:
+            list[Email]: Emails to process (possibly empty).
+
+        Raises:
+            ValueError: If ``folder_label`` cannot be resolved.
+        """
         batch_size = limit or self.settings.email_batch_size
         target_folder_id = folder_id or self.settings.inbox_folder_id
 
         logger.info(f"Starting email categorization (batch_size={batch_size})")
 
         # Allow per-run override of target mailbox (client-credentials mode)
-        if target_user_principal_name:
-            self.settings.target_user_principal_name = target_user_principal_name
-            logger.info(f"Using per-run target_user_principal_name={target_user_principal_name}")
+        self._configure_target(target_user_principal_name)
 
         # Initialize folder cache (needed for label resolution and destination folders).
         self.folder_manager.initialize()
 
+        # Destination folders and categorizations are memoized per run;
+        # folder ids may change after the refresh above, and bounding the
+        # dedupe cache to one batch keeps results fresh.
+        self._destination_cache.clear()
+        self._categorize_cache.clear()
+
         if folder_label:
             resolved = self.folder_manager.resolve_folder_label(folder_label)
             if not resolved:
@@ -238,10 +557,7 @@ class EmailOrchestrator:
         
         if target_folder_id and folder_label:
             # Explicit folder label: include subfolders
-            folders = self.folder_manager.get_descendant_folders(
-                target_folder_id,
-                include_self=True,
-            )
+            folders = self._get_descendant_folders_cached(target_folder_id)
             folder_ids = [f.id for f in folders]
             logger.info(
                 "Including subfolders for folder_label=%s (total folders=%s)",
@@ -252,26 +568,37 @@ class EmailOrchestrator:
             seen: set[str] = set()
             emails = []
 
-            remaining = batch_size
-            for fid in folder_ids:
-                if remaining <= 0:
-                    break
-
-                chunk = self.email_client.get_emails(
-                    folder_id=fid,
-                    limit=remaining,
-                    skip_flagged=True,
-                    skip_categorized=skip_categorized,
-                )
+            # Fetch folders concurrently; each Graph call is latency-bound so
+            # overlapping round-trips gives near-linear speedup up to the cap.
+            # Each folder is asked for the full batch since the per-folder
+            # split is unknown up front; results are merged in folder order
+            # and trimmed to the batch size below.
+            max_workers = min(_MAX_CONCURRENT_FETCHES, len(folder_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self.email_client.get_emails,
+                        folder_id=fid,
+                        limit=batch_size,
+                        skip_flagged=True,
+                        skip_categorized=skip_categorized,
+                    )
+                    for fid in folder_ids
+                ]
 
-                for email in chunk:
-                    if email.id in seen:
+                for future in futures:
+                    if len(emails) >= batch_size:
+                        future.cancel()
                         continue
-                    seen.add(email.id)
-                    emails.append(email)
-                    remaining -= 1
-                    if remaining <= 0:
-                        break
+
+                    chunk = future.result()
+                    for email in chunk:
+                        if email.id in seen:
+                            continue
+                        seen.add(email.id)
+                        emails.append(email)
+                        if len(emails) >= batch_size:
+                            break
         elif target_folder_id:
             # Folder ID specified but no label: fetch from that folder only (no subfolders)
             logger.info(f"Fetching from single folder (no subfolders): {target_folder_id}")
@@ -291,57 +618,7 @@ class EmailOrchestrator:
                 skip_categorized=skip_categorized,
             )
 
-        if not emails:
-            logger.info("No emails to process")
-            return []
-
-        logger.info(f"Processing {len(emails)} emails")
-
-        results = []
-        for i, email in enumerate(emails, 1):
-            logger.info(f"Processing email {i}/{len(emails)}: {email.subject[:50]}...")
-
-            if dry_run:
-                # Dry run: categorize only
-                categorization = self.categorizer.categorize(email)
-                if categorization:
-                    results.append(
-                        ProcessingResult(
-                            email_id=email.id,
-                            subject=email.subject,
-                            sender=email.sender_email,
-                            received_date_time=email.received_date_time,
-                            category=categorization.category,
-                            sub_category=categorization.sub_category,
-                            sender_goal=categorization.sender_goal,
-                            success=True,
-                            error="DRY RUN - not moved",
-                        )
-                    )
-                else:
-                    results.append(
-                        ProcessingResult(
-                            email_id=email.id,
-                            subject=email.subject,
-                            sender=email.sender_email,
-                            received_date_time=email.received_date_time,
-                            category="Other",
-                            success=False,
-                            error="Failed to categorize",
-                        )
-                    )
-            else:
-                # Full processing
-                result = self.process_email(email)
-                results.append(result)
-
-        # Summary
-        successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
-
-        logger.info(f"Completed: {successful} successful, {failed} failed")
-
-        return results
+        return emails
 
 
 def run_categorizer(
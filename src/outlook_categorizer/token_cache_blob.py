@@ -17,18 +17,35 @@ Operational notes:
 
 from __future__ import annotations
 
-import json
 import logging
+import random
 import time
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
-from azure.core.exceptions import ResourceNotFoundError, ResourceModifiedError
+import orjson
+from azure.core import MatchConditions
+from azure.core.exceptions import (
+    ResourceModifiedError,
+    ResourceNotFoundError,
+    ResourceNotModifiedError,
+)
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import BlobClient
 
 logger = logging.getLogger(__name__)
 
+# How long a downloaded cache payload is served from memory before it is
+# revalidated against the service (seconds). MSAL reads the cache on every
+# token lookup, so even a short window collapses request bursts into one GET.
+_DOWNLOAD_CACHE_TTL = 30.0
+
+# How long a missing blob is remembered as missing (seconds). Fresh
+# deployments probe the cache repeatedly during warm-up; a short negative TTL
+# keeps those probes local without delaying pickup of a newly created blob
+# for long.
+_NOT_FOUND_TTL = 5.0
+
 
 @dataclass(frozen=True)
 class BlobTokenCacheLocation:
@@ -62,6 +79,15 @@ class BlobTokenCacheStore:
         self._location = location
         self._credential = DefaultAzureCredential(exclude_interactive_browser_credential=True)
 
+        # Read-through cache of the last known (cache_json, etag), with the
+        # monotonic timestamp of when it was fetched or revalidated.
+        self._cached: Tuple[Optional[str], Optional[str]] = (None, None)
+        self._cached_at: float = float("-inf")
+
+        # Until this monotonic deadline the blob is known not to exist, so
+        # startup probes can skip the network round-trip entirely.
+        self._not_found_until: float = 0.0
+
     def _get_blob_client(self) -> BlobClient:
         """Create a BlobClient using DefaultAzureCredential.
 
@@ -76,23 +102,59 @@ class BlobTokenCacheStore:
             credential=self._credential,
         )
 
+    def invalidate(self) -> None:
+        """Drop the in-memory copy so the next download hits the service."""
+
+        self._cached = (None, None)
+        self._cached_at = float("-inf")
+        self._not_found_until = 0.0
+
     def download(self) -> Tuple[Optional[str], Optional[str]]:
         """Download the token cache JSON and its ETag.
 
+        Within a short TTL window, repeat calls are served from the in-memory
+        copy without any network traffic. Beyond the TTL the cached ETag is
+        revalidated via a conditional GET, so an unchanged blob costs a
+        304-style round-trip instead of a full body transfer.
+
         Returns:
             tuple[Optional[str], Optional[str]]: (cache_json, etag). If the blob
             does not exist, returns (None, None).
         """
 
+        now = time.monotonic()
+        if now < self._not_found_until:
+            return None, None
+
+        cached_json, cached_etag = self._cached
+        if cached_etag is not None and now - self._cached_at < _DOWNLOAD_CACHE_TTL:
+            return cached_json, cached_etag
+
+        download_kwargs = {}
+        if cached_etag is not None:
+            # Revalidate: only transfer the body if the blob changed.
+            download_kwargs = {
+                "etag": cached_etag,
+                "match_condition": MatchConditions.IfModified,
+            }
+
         client = self._get_blob_client()
         try:
-            stream = client.download_blob()
+            stream = client.download_blob(**download_kwargs)
             data = stream.readall()
-            props = client.get_blob_properties()
-            etag = props.etag
+            # The download response already carries the ETag; no need for a
+            # separate get_blob_properties round-trip.
+            etag = stream.properties.etag
             cache_json = data.decode("utf-8") if isinstance(data, (bytes, bytearray)) else str(data)
+            self._cached = (cache_json, etag)
+            self._cached_at = now
             return cache_json, etag
+        except ResourceNotModifiedError:
+            self._cached_at = now
+            return cached_json, cached_etag
         except ResourceNotFoundError:
+            self.invalidate()
+            self._not_found_until = now + _NOT_FOUND_TTL
             return None, None
 
     def upload(self, cache_json: str, etag: Optional[str], max_retries: int = 5) -> str:
@@ -112,25 +174,44 @@ class BlobTokenCacheStore:
 
         client = self._get_blob_client()
 
+        # Encode once; retries reuse the same bytes, and the explicit length
+        # lets the SDK skip probing the payload size.
+        payload = cache_json.encode("utf-8")
+
         for attempt in range(max_retries):
             try:
                 if etag is None:
                     # Create only if it doesn't exist
-                    client.upload_blob(cache_json.encode("utf-8"), overwrite=False)
+                    result = client.upload_blob(
+                        payload, length=len(payload), overwrite=False
+                    )
                 else:
                     # Overwrite only if ETag matches
-                    client.upload_blob(
-                        cache_json.encode("utf-8"),
+                    result = client.upload_blob(
+                        payload,
+                        length=len(payload),
                         overwrite=True,
                         if_match=etag,
                     )
 
-                new_etag = client.get_blob_properties().etag
+                # upload_blob returns the new blob properties (including the
+                # ETag), so the post-upload properties call is unnecessary.
+                new_etag = result["etag"]
+                self._cached = (cache_json, new_etag)
+                self._cached_at = time.monotonic()
+                # The blob certainly exists now.
+                self._not_found_until = 0.0
                 return new_etag
             except ResourceModifiedError:
-                # Someone updated the blob between download and upload
+                # Someone updated the blob between download and upload; the
+                # in-memory copy is stale by definition, so refetch for real.
                 logger.warning("Token cache blob ETag conflict; retrying (attempt=%s)", attempt + 1)
+                self.invalidate()
                 latest, latest_etag = self.download()
+                # If another writer already stored identical content, there is
+                # nothing left to upload.
+                if latest == cache_json and latest_etag is not None:
+                    return latest_etag
                 etag = latest_etag
                 # If latest is None, try create on next loop
                 if latest is None:
@@ -138,8 +219,9 @@ class BlobTokenCacheStore:
             except Exception as exc:
                 raise RuntimeError(f"Failed to upload token cache blob: {exc}") from exc
 
-            # Small backoff
-            time.sleep(0.2 * (attempt + 1))
+            # Exponential backoff with jitter so concurrent writers do not
+            # synchronize their retries.
+            time.sleep(min(2.0, 0.1 * (2 ** attempt)) * random.uniform(0.5, 1.5))
 
         raise RuntimeError("Failed to upload token cache blob due to repeated ETag conflicts")
 
@@ -147,6 +229,9 @@ class BlobTokenCacheStore:
 def is_valid_msal_cache_json(payload: str) -> bool:
     """Validate that a string is valid JSON for MSAL cache serialization.
 
+    Parsing uses orjson (native, SIMD-accelerated), which is markedly faster
+    than the stdlib parser on the typical few-KB MSAL cache payload.
+
     Args:
         payload: JSON string.
 
@@ -155,7 +240,7 @@ def is_valid_msal_cache_json(payload: str) -> bool:
     """
 
     try:
-        json.loads(payload)
+        orjson.loads(payload)
         return True
     except Exception:
         return False
@@ -31,22 +31,112 @@ Operational notes:
 
 from __future__ import annotations
 
-from typing import Any, Optional
-
-from fastapi.responses import JSONResponse
-
+import functools
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated, Any, AsyncIterator, Iterator, Optional
+
+import anyio
+import anyio.to_thread
+import jinja2
+import orjson
 from fastapi import Depends, FastAPI, Form, Request
-from fastapi.responses import HTMLResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
 from .auth import DeviceCodeAuthRequired, GraphAuthenticator
 from .config import get_settings
+from .models import ProcessingResult
 from .orchestrator import EmailOrchestrator
 
+# Bulk serializer for result lists: one Rust-side call dumps the whole list
+# instead of a Python-level model_dump() per item.
+_RESULTS_ADAPTER: TypeAdapter[list[ProcessingResult]] = TypeAdapter(list[ProcessingResult])
+
+
+# Module-level templates so the compiled-template cache survives repeated
+# create_app() calls (tests, multi-worker reloads); the bytecode cache
+# additionally persists compiled templates across process restarts.
+_JINJA_CACHE_DIR = Path(tempfile.gettempdir()) / "outlook_categorizer_jinja_cache"
+_JINJA_CACHE_DIR.mkdir(exist_ok=True)
+
+TEMPLATES = Jinja2Templates(directory="src/outlook_categorizer/templates")
+TEMPLATES.env.bytecode_cache = jinja2.FileSystemBytecodeCache(str(_JINJA_CACHE_DIR))
+
+
+class RunRequest(BaseModel):
+    """Request body for ``POST /api/run``.
+
+    Validation happens in pydantic-core (Rust) instead of manual dict.get
+    calls per request; unknown keys are ignored to keep the API lenient.
+
+    Attributes:
+        limit: Maximum number of emails to process.
+        folder_label: Human-friendly source folder label or path.
+        dry_run: If True, categorize but don't move emails.
+        target_user_principal_name: Override TARGET_USER_PRINCIPAL_NAME for this run.
+    """
+
+    limit: Optional[int] = None
+    folder_label: Optional[str] = None
+    dry_run: bool = False
+    target_user_principal_name: Optional[str] = None
+
+    model_config = ConfigDict(extra="ignore")
+
+
+@dataclass(slots=True)
+class RunForm:
+    """Form fields for ``POST /run``.
+
+    Grouping the fields into one slotted dataclass dependency lets FastAPI
+    resolve them through a single cached validator instead of building a
+    per-request kwargs dict for five separate parameters.
+
+    Attributes:
+        limit: Maximum number of emails to process.
+        folder_label: Human-friendly source folder label or path.
+        dry_run: If True, categorize but don't move emails.
+        target_user_principal_name: Override TARGET_USER_PRINCIPAL_NAME for this run.
+    """
+
+    limit: Annotated[Optional[int], Form()] = None
+    folder_label: Annotated[Optional[str], Form()] = None
+    dry_run: Annotated[bool, Form()] = False
+    target_user_principal_name: Annotated[Optional[str], Form()] = None
+
 
 # Shared authenticator to persist token cache across web requests
 _shared_authenticator: Optional[GraphAuthenticator] = None
 
+# Limits how many categorizer runs execute concurrently on worker threads.
+# Created lazily because anyio primitives should be constructed inside a
+# running event loop.
+_run_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _get_run_limiter() -> anyio.CapacityLimiter:
+    """Return the shared capacity limiter for categorizer runs.
+
+    The limit comes from ``settings.max_concurrent_runs`` when settings are
+    available; otherwise (e.g. in tests without a configured environment) it
+    falls back to the settings default.
+
+    Returns:
+        anyio.CapacityLimiter: Shared limiter instance.
+    """
+    global _run_limiter
+    if _run_limiter is None:
+        try:
+            tokens = get_settings().max_concurrent_runs
+        except Exception:
+            tokens = 4
+        _run_limiter = anyio.CapacityLimiter(tokens)
+    return _run_limiter
+
 
 def get_shared_authenticator() -> GraphAuthenticator:
     """Return a singleton GraphAuthenticator for the webapp.
@@ -67,20 +157,37 @@ def get_shared_authenticator() -> GraphAuthenticator:
     return _shared_authenticator
 
 
+# Singleton orchestrator for the webapp. Construction builds SDK clients
+# (Groq, Graph auth), which is not per-request work; FastAPI re-invokes
+# Depends(get_orchestrator) on every call.
+_orchestrator: Optional[EmailOrchestrator] = None
+_orchestrator_lock = threading.Lock()
+
+
 def get_orchestrator() -> EmailOrchestrator:
-    """Create an :class:`~src.outlook_categorizer.orchestrator.EmailOrchestrator`.
+    """Return the shared :class:`~src.outlook_categorizer.orchestrator.EmailOrchestrator`.
 
     This function exists primarily to support FastAPI dependency injection and
     testing. Production code uses the real orchestrator; tests can override this
     dependency with a stub object implementing ``run(...)``.
 
+    The orchestrator is created once and reused across requests; per-run state
+    (folder caches, dedupe caches) is reset inside ``run()`` itself, and
+    concurrent requests serialize on the orchestrator's internal run lock so
+    one run cannot observe another's half-rebuilt caches.
+
     Returns:
-        EmailOrchestrator: A new orchestrator instance.
+        EmailOrchestrator: The shared orchestrator instance.
     """
-    settings = get_settings()
-    # Use shared authenticator to keep token cache in memory across requests
-    auth = get_shared_authenticator()
-    return EmailOrchestrator(settings=settings, auth=auth)
+    global _orchestrator
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                settings = get_settings()
+                # Use shared authenticator to keep token cache in memory across requests
+                auth = get_shared_authenticator()
+                _orchestrator = EmailOrchestrator(settings=settings, auth=auth)
+    return _orchestrator
 
 
 def create_app() -> FastAPI:
@@ -106,9 +213,9 @@ def create_app() -> FastAPI:
         FastAPI: FastAPI app.
     """
 
-    app = FastAPI(title="Outlook Email Categorizer")
-
-    templates = Jinja2Templates(directory="src/outlook_categorizer/templates")
+    # orjson serializes in C and handles datetimes natively, so JSON routes
+    # skip the stdlib encoder.
+    app = FastAPI(title="Outlook Email Categorizer", default_response_class=ORJSONResponse)
 
     @app.get("/health")
     def health() -> dict[str, str]:
@@ -139,20 +246,12 @@ def create_app() -> FastAPI:
             Any: Template response.
         """
 
-        return templates.TemplateResponse(
-            "index.html",
-            {
-                "request": request,
-            },
-        )
+        return TEMPLATES.TemplateResponse(request, "index.html")
 
     @app.post("/run", response_class=HTMLResponse)
-    def run_html(
+    async def run_html(
         request: Request,
-        limit: Optional[int] = Form(default=None),
-        folder_label: Optional[str] = Form(default=None),
-        dry_run: bool = Form(default=False),
-        target_user_principal_name: Optional[str] = Form(default=None),
+        form: Annotated[RunForm, Depends()],
         orchestrator: EmailOrchestrator = Depends(get_orchestrator),
     ) -> Any:
         """Run the categorizer via HTML form and render results.
@@ -162,23 +261,36 @@ def create_app() -> FastAPI:
 
         Args:
             request: FastAPI request.
-            limit: Maximum number of emails.
-            folder_label: Human-friendly source folder label or path.
-            dry_run: If True, do not move emails.
-            target_user_principal_name: Override TARGET_USER_PRINCIPAL_NAME for this run.
+            form: Parsed form fields (see :class:`RunForm`).
             orchestrator: Orchestrator dependency.
 
         Returns:
             Any: Template response.
         """
 
+        limit = form.limit
+        folder_label = form.folder_label
+        dry_run = form.dry_run
+        target_user_principal_name = form.target_user_principal_name
+
         try:
-            results = orchestrator.run(limit=limit, folder_label=folder_label, dry_run=dry_run, target_user_principal_name=target_user_principal_name)
+            # Offload the blocking run to a worker thread so the event loop
+            # stays free; the limiter bounds concurrent runs explicitly.
+            results = await anyio.to_thread.run_sync(
+                functools.partial(
+                    orchestrator.run,
+                    limit=limit,
+                    folder_label=folder_label,
+                    dry_run=dry_run,
+                    target_user_principal_name=target_user_principal_name,
+                ),
+                limiter=_get_run_limiter(),
+            )
         except DeviceCodeAuthRequired as e:
-            return templates.TemplateResponse(
+            return TEMPLATES.TemplateResponse(
+                request,
                 "auth_required.html",
                 {
-                    "request": request,
                     "verification_uri": e.verification_uri,
                     "user_code": e.user_code,
                     "message": e.message,
@@ -190,56 +302,63 @@ def create_app() -> FastAPI:
                 status_code=401,
             )
 
+        # Single pass: success is a bool, so summing it counts successes.
+        successful = sum(r.success for r in results)
+        total = len(results)
         summary = {
-            "total": len(results),
-            "successful": sum(1 for r in results if r.success),
-            "failed": sum(1 for r in results if not r.success),
+            "total": total,
+            "successful": successful,
+            "failed": total - successful,
         }
 
-        return templates.TemplateResponse(
-            "results.html",
-            {
-                "request": request,
-                "results": results,
-                "summary": summary,
-                "limit": limit,
-                "folder_label": folder_label,
-                "dry_run": dry_run,
-            },
+        # Stream the results table instead of materializing the full HTML
+        # string: the first rows reach the client while later rows are still
+        # rendering. Buffering amortizes per-chunk write overhead.
+        stream = TEMPLATES.env.get_template("results.html").stream(
+            request=request,
+            results=results,
+            summary=summary,
+            limit=limit,
+            folder_label=folder_label,
+            dry_run=dry_run,
         )
+        stream.enable_buffering(size=50)
+        return StreamingResponse(stream, media_type="text/html")
 
     @app.post("/api/run")
-    def run_api(
-        payload: dict[str, Any],
+    async def run_api(
+        payload: RunRequest,
         orchestrator: EmailOrchestrator = Depends(get_orchestrator),
-    ) -> dict[str, Any]:
+    ) -> Any:
         """Run the categorizer via JSON API.
 
         Expected request body:
             ``{"limit": 5, "folder_label": "Inbox/Boss", "dry_run": true}``
 
-        Notes:
-            This endpoint deliberately uses a minimal unvalidated dict payload
-            to keep the API surface small. If you want stricter validation, we
-            can introduce a Pydantic request model.
-
         Args:
-            payload: JSON payload with keys: limit, folder_label, dry_run.
+            payload: Validated run parameters (see :class:`RunRequest`).
             orchestrator: Orchestrator dependency.
 
         Returns:
-            dict[str, Any]: Results payload.
+            Any: JSON response with results and summary.
         """
 
-        limit = payload.get("limit")
-        folder_label = payload.get("folder_label")
-        dry_run = bool(payload.get("dry_run", False))
-        target_user_principal_name = payload.get("target_user_principal_name")
+        run_kwargs: dict[str, Any] = {
+            "limit": payload.limit,
+            "folder_label": payload.folder_label,
+            "dry_run": payload.dry_run,
+        }
+        # Only forward the mailbox override when the caller supplied one.
+        if payload.target_user_principal_name is not None:
+            run_kwargs["target_user_principal_name"] = payload.target_user_principal_name
 
         try:
-            results = orchestrator.run(limit=limit, folder_label=folder_label, dry_run=dry_run, target_user_principal_name=target_user_principal_name)
+            results = await anyio.to_thread.run_sync(
+                functools.partial(orchestrator.run, **run_kwargs),
+                limiter=_get_run_limiter(),
+            )
         except DeviceCodeAuthRequired as e:
-            return JSONResponse(
+            return ORJSONResponse(
                 {
                     "error": "authentication_required",
                     "verification_uri": e.verification_uri,
@@ -249,14 +368,97 @@ def create_app() -> FastAPI:
                 status_code=401,
             )
 
-        return {
-            "results": [r.model_dump() for r in results],
-            "summary": {
-                "total": len(results),
-                "successful": sum(1 for r in results if r.success),
-                "failed": sum(1 for r in results if not r.success),
-            },
+        # One Rust-side dump of the whole list, then a single pass over the
+        # dicts for the summary (success is a bool, so summing counts it).
+        dumped = _RESULTS_ADAPTER.dump_python(results, mode="json")
+        successful = sum(d["success"] for d in dumped)
+        total = len(dumped)
+
+        # Returning a Response directly skips FastAPI's jsonable_encoder pass
+        # over every result.
+        return ORJSONResponse(
+            {
+                "results": dumped,
+                "summary": {
+                    "total": total,
+                    "successful": successful,
+                    "failed": total - successful,
+                },
+            }
+        )
+
+    @app.post("/api/run/stream")
+    async def run_api_stream(
+        payload: RunRequest,
+        orchestrator: EmailOrchestrator = Depends(get_orchestrator),
+    ) -> Any:
+        """Run the categorizer, streaming per-email results as SSE.
+
+        Each processed email is emitted as a ``data:`` event the moment it
+        completes, followed by a final ``summary`` event, so time-to-first-
+        result is one email's work instead of the whole batch and memory per
+        connection stays constant.
+
+        Args:
+            payload: Validated run parameters (see :class:`RunRequest`).
+            orchestrator: Orchestrator dependency.
+
+        Returns:
+            Any: ``text/event-stream`` response.
+        """
+
+        run_kwargs: dict[str, Any] = {
+            "limit": payload.limit,
+            "folder_label": payload.folder_label,
+            "dry_run": payload.dry_run,
         }
+        if payload.target_user_principal_name is not None:
+            run_kwargs["target_user_principal_name"] = payload.target_user_principal_name
+
+        def _events() -> Iterator[bytes]:
+            total = 0
+            successful = 0
+            try:
+                for result in orchestrator.run_iter(**run_kwargs):
+                    total += 1
+                    successful += bool(result.success)
+                    yield b"data: " + orjson.dumps(result.model_dump()) + b"\n\n"
+            except DeviceCodeAuthRequired as e:
+                yield b"event: error\ndata: " + orjson.dumps(
+                    {
+                        "error": "authentication_required",
+                        "verification_uri": e.verification_uri,
+                        "user_code": e.user_code,
+                        "message": e.message,
+                    }
+                ) + b"\n\n"
+                return
+
+            yield b"event: summary\ndata: " + orjson.dumps(
+                {
+                    "total": total,
+                    "successful": successful,
+                    "failed": total - successful,
+                }
+            ) + b"\n\n"
+
+        async def _stream() -> AsyncIterator[bytes]:
+            # Hold the run limiter for the stream's lifetime so SSE runs count
+            # against the same concurrency cap as /run and /api/run. Each
+            # event is pulled from the sync generator on a worker thread,
+            # keeping the event loop free between emails.
+            async with _get_run_limiter():
+                events = _events()
+                try:
+                    while True:
+                        chunk = await anyio.to_thread.run_sync(next, events, None)
+                        if chunk is None:
+                            return
+                        yield chunk
+                finally:
+                    events.close()
+
+        return StreamingResponse(_stream(), media_type="text/event-stream")
 
     @app.post("/auth/complete", response_class=HTMLResponse)
     def auth_complete(
@@ -284,10 +486,10 @@ def create_app() -> FastAPI:
         """
 
         _ = state_id
-        return templates.TemplateResponse(
+        return TEMPLATES.TemplateResponse(
+            request,
             "index.html",
             {
-                "request": request,
                 "limit": limit,
                 "folder_label": folder_label,
                 "dry_run": dry_run,
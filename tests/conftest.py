@@ -0,0 +1,29 @@
+"""Shared test fixtures and fakes."""
+
+
+class FakeEmailClient:
+    """Minimal EmailClient stand-in for folder manager tests.
+
+    Cheaper than a MagicMock: no call recording machinery, just the two
+    methods FolderManager uses plus explicit call bookkeeping.
+    """
+
+    def __init__(self, folder_batches=(), created=None):
+        # Successive get_folders() results; the last batch repeats once the
+        # earlier ones are consumed (mirrors MagicMock side_effect lists).
+        self._folder_batches = [list(batch) for batch in folder_batches]
+        self.created = created
+        self.create_folder_calls = []
+        self.get_folders_calls = 0
+
+    def get_folders(self, include_children=True):
+        self.get_folders_calls += 1
+        if not self._folder_batches:
+            return []
+        if len(self._folder_batches) > 1:
+            return self._folder_batches.pop(0)
+        return self._folder_batches[0]
+
+    def create_folder(self, name, parent_id=None):
+        self.create_folder_calls.append((name, parent_id))
+        return self.created
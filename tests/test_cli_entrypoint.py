@@ -1,24 +1,25 @@
-import runpy
+import importlib.util
 from pathlib import Path
 
+# Resolved once: Path.resolve() walks the realpath chain on every call.
+_CLI_PATH = Path(__file__).resolve().parents[1] / "src" / "outlook_categorizer" / "cli.py"
 
-def test_cli_can_be_loaded_via_runpy_without_package_context() -> None:
+
+def test_cli_can_be_loaded_without_package_context() -> None:
     """Load cli.py as a script module without executing main.
 
     This verifies the ImportError fallback path works (relative import fails,
     then absolute import succeeds after adding the src root to sys.path).
+    Loading through importlib (rather than runpy.run_path) reuses the cached
+    bytecode in __pycache__ across runs.
     """
 
-    project_root = Path(__file__).resolve().parents[1]
-    cli_path = project_root / "src" / "outlook_categorizer" / "cli.py"
-
-    runpy.run_path(str(cli_path), run_name="_cli_test_")
+    spec = importlib.util.spec_from_file_location("_cli_test_", _CLI_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
 
 
 def test_cli_path_is_expected() -> None:
     """Ensure the cli.py path exists (sanity check for repository layout)."""
 
-    project_root = Path(__file__).resolve().parents[1]
-    cli_path = project_root / "src" / "outlook_categorizer" / "cli.py"
-
-    assert cli_path.exists()
+    assert _CLI_PATH.exists()
@@ -1,10 +1,12 @@
+import io
+import sys
 from datetime import datetime
 
 from src.outlook_categorizer.cli import print_results
 from src.outlook_categorizer.models import ProcessingResult
 
 
-def test_print_results_includes_date_and_sender(capsys) -> None:
+def test_print_results_includes_date_and_sender(monkeypatch) -> None:
     """Ensure CLI output includes short date and sender when available."""
 
     results = [
@@ -20,9 +22,13 @@ def test_print_results_includes_date_and_sender(capsys) -> None:
         )
     ]
 
+    # A plain StringIO avoids routing the output through pytest's capture plugin.
+    buffer = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buffer)
+
     print_results(results, verbose=False)
 
-    captured = capsys.readouterr().out
+    captured = buffer.getvalue()
     assert "[12-15]" in captured
     assert "alice@example.com" in captured
     assert "Hello World" in captured
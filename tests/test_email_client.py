@@ -1,69 +1,51 @@
 from unittest.mock import MagicMock
 
+import pytest
 import requests
 
 from src.outlook_categorizer.email_client import EmailClient
 
+# Shared error fixture; tests only read this, never mutate it.
+_NOT_FOUND = requests.HTTPError(response=MagicMock(status_code=404))
 
-def test_get_emails_defaults_to_inbox_endpoint() -> None:
-    """Ensure get_emails fetches only Inbox when folder_id is None."""
 
-    settings = MagicMock()
-    auth = MagicMock()
-    client = EmailClient(settings, auth)
-
-    client._make_request = MagicMock(return_value={"value": []})
-
-    client.get_emails(folder_id=None, limit=5)
-
-    client._make_request.assert_called_once()
-    args, kwargs = client._make_request.call_args
-    assert args[0] == "GET"
-    assert args[1] == "/me/mailFolders/inbox/messages"
-
-
-def test_get_emails_uses_specific_folder_endpoint() -> None:
-    """Ensure get_emails uses mailFolders/{id}/messages when folder_id is provided."""
+@pytest.fixture
+def client():
+    """EmailClient in delegated (/me) mode with _make_request stubbed out."""
 
     settings = MagicMock()
+    settings.use_client_credentials = False
+    settings.target_user_principal_name = None
     auth = MagicMock()
-    client = EmailClient(settings, auth)
 
+    client = EmailClient(settings, auth)
     client._make_request = MagicMock(return_value={"value": []})
-
-    client.get_emails(folder_id="folder-123", limit=5)
-
-    client._make_request.assert_called_once()
-    args, kwargs = client._make_request.call_args
-    assert args[0] == "GET"
-    assert args[1] == "/me/mailFolders/folder-123/messages"
+    return client
 
 
-def test_get_emails_url_encodes_folder_id() -> None:
-    """Ensure get_emails URL-encodes folder IDs containing special characters."""
+@pytest.mark.parametrize(
+    "folder_id, expected_path",
+    [
+        pytest.param(None, "/me/mailFolders/inbox/messages", id="defaults_to_inbox"),
+        pytest.param("folder-123", "/me/mailFolders/folder-123/messages", id="specific_folder"),
+        pytest.param("a/b+c=", "/me/mailFolders/a%2Fb%2Bc%3D/messages", id="url_encodes_folder_id"),
+    ],
+)
+def test_get_emails_endpoint(client, folder_id, expected_path) -> None:
+    """Ensure get_emails targets the right (URL-encoded) mailFolders endpoint."""
 
-    settings = MagicMock()
-    auth = MagicMock()
-    client = EmailClient(settings, auth)
-
-    client._make_request = MagicMock(return_value={"value": []})
-
-    client.get_emails(folder_id="a/b+c=", limit=5)
+    client.get_emails(folder_id=folder_id, limit=5)
 
     client._make_request.assert_called_once()
     args, kwargs = client._make_request.call_args
     assert args[0] == "GET"
-    assert args[1] == "/me/mailFolders/a%2Fb%2Bc%3D/messages"
+    assert args[1] == expected_path
 
 
-def test_move_email_url_encodes_message_id() -> None:
+def test_move_email_url_encodes_message_id(client) -> None:
     """Ensure move_email URL-encodes message IDs before calling Graph."""
 
-    settings = MagicMock()
-    auth = MagicMock()
-    client = EmailClient(settings, auth)
-
-    client._make_request = MagicMock(return_value={})
+    client._make_request.return_value = {}
 
     assert client.move_email(email_id="AQM+/=", folder_id="dest") is True
 
@@ -74,17 +56,10 @@ def test_move_email_url_encodes_message_id() -> None:
     assert kwargs["json_data"] == {"destinationId": "dest"}
 
 
-def test_move_email_falls_back_to_folder_scoped_endpoint_on_404() -> None:
+def test_move_email_falls_back_to_folder_scoped_endpoint_on_404(client) -> None:
     """When /me/messages/{id}/move returns 404, retry via folder-scoped message URL."""
 
-    settings = MagicMock()
-    auth = MagicMock()
-    client = EmailClient(settings, auth)
-
-    not_found_response = MagicMock(status_code=404)
-    not_found_error = requests.HTTPError(response=not_found_response)
-
-    client._make_request = MagicMock(side_effect=[not_found_error, {}])
+    client._make_request.side_effect = [_NOT_FOUND, {}]
 
     moved = client.move_email(email_id="AQM+/=", folder_id="dest", source_folder_id="src")
     assert moved is True
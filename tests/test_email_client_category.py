@@ -1,23 +1,40 @@
 """Tests for email category tagging functionality."""
 
 import pytest
+import requests
 from unittest.mock import Mock, patch
 from src.outlook_categorizer.email_client import EmailClient
 from src.outlook_categorizer.config import Settings
 
+# Shared error fixtures; tests only read these, never mutate them.
+_NOT_FOUND = requests.HTTPError()
+_NOT_FOUND.response = Mock(status_code=404)
+_SERVER_ERROR = requests.HTTPError()
+_SERVER_ERROR.response = Mock(status_code=500)
 
-@pytest.fixture
-def email_client():
-    """Create email client with mocked auth."""
+
+@pytest.fixture(scope="module")
+def _shared_email_client():
+    """Build Settings and the EmailClient once for the whole module.
+
+    Settings validation and the GraphAuthenticator patch are paid a single
+    time; per-test isolation is restored by the function-scoped
+    ``email_client`` fixture below.
+    """
     settings = Settings(
         azure_client_id="test-client-id",
         azure_tenant_id="test-tenant-id",
         groq_api_key="test-groq-key",
     )
-    with patch("src.outlook_categorizer.email_client.GraphAuthenticator"):
-        client = EmailClient(settings)
-        client._make_request = Mock()
-        return client
+    with patch("src.outlook_categorizer.email_client.GraphAuthenticator") as auth_cls:
+        yield EmailClient(settings, auth_cls(settings))
+
+
+@pytest.fixture
+def email_client(_shared_email_client, monkeypatch):
+    """Shared email client with a fresh _make_request mock per test."""
+    monkeypatch.setattr(_shared_email_client, "_make_request", Mock())
+    return _shared_email_client
 
 
 def test_add_category_success(email_client):
@@ -36,20 +53,17 @@ def test_add_category_success(email_client):
 
 def test_add_category_failure(email_client):
     """Test handling failure when adding category."""
-    import requests
-    error = requests.HTTPError()
-    error.response = Mock(status_code=500)
-    email_client._make_request.side_effect = error
+    email_client._make_request.side_effect = _SERVER_ERROR
     
     result = email_client.add_category("test-email-id", "Categorized")
     
     assert result is False
 
 
-def test_move_email_with_category(email_client):
+def test_move_email_with_category(email_client, monkeypatch):
     """Test moving email and adding category tag."""
     email_client._make_request.return_value = {}
-    email_client.add_category = Mock(return_value=True)
+    monkeypatch.setattr(email_client, "add_category", Mock(return_value=True))
     
     result = email_client.move_email(
         "test-email-id",
@@ -64,10 +78,10 @@ def test_move_email_with_category(email_client):
     email_client.add_category.assert_called_once_with("test-email-id", "Categorized")
 
 
-def test_move_email_without_category(email_client):
+def test_move_email_without_category(email_client, monkeypatch):
     """Test moving email without adding category tag."""
     email_client._make_request.return_value = {}
-    email_client.add_category = Mock(return_value=True)
+    monkeypatch.setattr(email_client, "add_category", Mock(return_value=True))
     
     result = email_client.move_email(
         "test-email-id",
@@ -81,17 +95,11 @@ def test_move_email_without_category(email_client):
     email_client.add_category.assert_not_called()
 
 
-def test_move_email_fallback_with_category(email_client):
+def test_move_email_fallback_with_category(email_client, monkeypatch):
     """Test fallback move also adds category tag."""
-    import requests
-    
-    # First call (primary move) fails with 404
-    error = requests.HTTPError()
-    error.response = Mock(status_code=404)
-    
-    # Second call (fallback move) succeeds
-    email_client._make_request.side_effect = [error, {}]
-    email_client.add_category = Mock(return_value=True)
+    # Primary move fails with 404; fallback move succeeds
+    email_client._make_request.side_effect = [_NOT_FOUND, {}]
+    monkeypatch.setattr(email_client, "add_category", Mock(return_value=True))
     
     result = email_client.move_email(
         "test-email-id",
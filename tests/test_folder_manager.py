@@ -3,17 +3,11 @@ Tests for the folder_manager module.
 """
 
 import pytest
-from unittest.mock import MagicMock
 
 from src.outlook_categorizer.folder_manager import FolderManager
 from src.outlook_categorizer.models import Folder, CategorizationResult
 
-
-@pytest.fixture
-def mock_email_client():
-    """Create mock email client."""
-    client = MagicMock()
-    return client
+from .conftest import FakeEmailClient
 
 
 @pytest.fixture
@@ -28,83 +22,86 @@ def sample_folders():
     ]
 
 
+@pytest.fixture
+def fake_client(sample_folders):
+    """Fake email client serving the sample folder list."""
+    return FakeEmailClient([sample_folders])
+
+
+@pytest.fixture
+def initialized_manager(fake_client):
+    """FolderManager already initialized against the sample folder list.
+
+    Tests that only read or extend this state share the single initialize()
+    pass; tests that assert on get_folders call counts or need bespoke folder
+    lists keep building their own manager.
+    """
+    manager = FolderManager(fake_client)
+    manager.initialize()
+    return manager
+
+
 class TestFolderManagerInitialization:
     """Tests for folder manager initialization."""
 
-    def test_initialize_loads_folders(self, mock_email_client, sample_folders):
+    def test_initialize_loads_folders(self, sample_folders):
         """Test that initialize loads and caches folders."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
+        client = FakeEmailClient([sample_folders])
 
-        manager = FolderManager(mock_email_client)
+        manager = FolderManager(client)
         manager.initialize()
 
         assert manager._initialized is True
         assert len(manager._folder_cache) == 5
-        assert mock_email_client.get_folders.call_count == 2
+        assert client.get_folders_calls == 2
 
-    def test_refresh_reloads_folders(self, mock_email_client, sample_folders):
+    def test_refresh_reloads_folders(self, sample_folders):
         """Test that refresh reloads folders."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders, sample_folders, sample_folders]
+        client = FakeEmailClient([sample_folders])
 
-        manager = FolderManager(mock_email_client)
+        manager = FolderManager(client)
         manager.initialize()
         manager.refresh()
 
-        assert mock_email_client.get_folders.call_count == 4
+        assert client.get_folders_calls == 4
 
 
 class TestFolderManagerLookup:
     """Tests for folder lookup operations."""
 
-    def test_get_folder_by_name_case_insensitive(self, mock_email_client, sample_folders):
+    def test_get_folder_by_name_case_insensitive(self, initialized_manager):
         """Test case-insensitive folder lookup by name."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
 
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
-
-        folder = manager.get_folder_by_name("action")
+        folder = initialized_manager.get_folder_by_name("action")
         assert folder is not None
         assert folder.display_name == "Action"
 
-        folder = manager.get_folder_by_name("ACTION")
+        folder = initialized_manager.get_folder_by_name("ACTION")
         assert folder is not None
         assert folder.display_name == "Action"
 
-    def test_get_folder_by_name_not_found(self, mock_email_client, sample_folders):
+    def test_get_folder_by_name_not_found(self, initialized_manager):
         """Test folder lookup when folder doesn't exist."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
-
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
 
-        folder = manager.get_folder_by_name("NonExistent")
+        folder = initialized_manager.get_folder_by_name("NonExistent")
         assert folder is None
 
-    def test_get_folder_by_id(self, mock_email_client, sample_folders):
+    def test_get_folder_by_id(self, initialized_manager):
         """Test folder lookup by ID."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
 
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
-
-        folder = manager.get_folder_by_id("folder-2")
+        folder = initialized_manager.get_folder_by_id("folder-2")
         assert folder is not None
         assert folder.display_name == "Action"
 
-    def test_resolve_folder_label_single_name(self, mock_email_client, sample_folders):
+    def test_resolve_folder_label_single_name(self, initialized_manager):
         """Resolve a single folder label by name."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
-
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
 
-        resolved = manager.resolve_folder_label("Inbox")
+        resolved = initialized_manager.resolve_folder_label("Inbox")
         assert resolved is not None
         assert resolved.id == "folder-1"
 
     def test_resolve_folder_label_single_name_prefers_root_when_duplicates_exist(
-        self, mock_email_client
+        self,
     ) -> None:
         """Prefer the root folder when multiple folders share the same name."""
 
@@ -121,16 +118,16 @@ class TestFolderManagerLookup:
             ),
             Folder(id="folder-action", displayName="Action", parentFolderId="root"),
         ]
-        mock_email_client.get_folders.side_effect = [root_folders, folders]
+        client = FakeEmailClient([root_folders, folders])
 
-        manager = FolderManager(mock_email_client)
+        manager = FolderManager(client)
         manager.initialize()
 
         resolved = manager.resolve_folder_label("Business")
         assert resolved is not None
         assert resolved.id == "root-business"
 
-    def test_resolve_folder_label_path(self, mock_email_client):
+    def test_resolve_folder_label_path(self):
         """Resolve a folder path like Inbox/Boss using child-folder scoping."""
         root_folders = [
             Folder(id="inbox", displayName="Inbox", parentFolderId="root"),
@@ -139,57 +136,45 @@ class TestFolderManagerLookup:
             Folder(id="inbox", displayName="Inbox", parentFolderId="root"),
             Folder(id="boss", displayName="Boss", parentFolderId="inbox"),
         ]
-        mock_email_client.get_folders.side_effect = [root_folders, folders]
+        client = FakeEmailClient([root_folders, folders])
 
-        manager = FolderManager(mock_email_client)
+        manager = FolderManager(client)
         manager.initialize()
 
         resolved = manager.resolve_folder_label("Inbox/Boss")
         assert resolved is not None
         assert resolved.id == "boss"
 
-    def test_resolve_folder_label_not_found(self, mock_email_client, sample_folders):
+    def test_resolve_folder_label_not_found(self, initialized_manager):
         """Return None when a label cannot be resolved."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
 
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
-
-        resolved = manager.resolve_folder_label("Inbox/DoesNotExist")
+        resolved = initialized_manager.resolve_folder_label("Inbox/DoesNotExist")
         assert resolved is None
 
 
 class TestFolderManagerCreation:
     """Tests for folder creation operations."""
 
-    def test_ensure_category_folder_exists(self, mock_email_client, sample_folders):
+    def test_ensure_category_folder_exists(self, fake_client, initialized_manager):
         """Test ensuring existing category folder."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
 
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
-
-        folder = manager.ensure_category_folder("Action")
+        folder = initialized_manager.ensure_category_folder("Action")
         assert folder is not None
         assert folder.display_name == "Action"
-        mock_email_client.create_folder.assert_not_called()
+        assert fake_client.create_folder_calls == []
 
-    def test_ensure_category_folder_creates_new(self, mock_email_client, sample_folders):
+    def test_ensure_category_folder_creates_new(self, fake_client, initialized_manager):
         """Test creating new category folder."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
         new_folder = Folder(id="folder-new", displayName="Receipt", parentFolderId=None)
-        mock_email_client.create_folder.return_value = new_folder
+        fake_client.created = new_folder
 
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
-
-        folder = manager.ensure_category_folder("Receipt")
+        folder = initialized_manager.ensure_category_folder("Receipt")
         assert folder is not None
         assert folder.display_name == "Receipt"
-        mock_email_client.create_folder.assert_called_once_with("Receipt")
+        assert fake_client.create_folder_calls == [("Receipt", None)]
 
     def test_ensure_category_folder_handles_conflict_by_refreshing_and_resolving(
-        self, mock_email_client
+        self,
     ) -> None:
         """Treat 409 conflict (create_folder returns None) as OK and resolve existing."""
 
@@ -201,37 +186,30 @@ class TestFolderManagerCreation:
             Folder(id="folder-subscriptions", displayName="Subscriptions", parentFolderId=None),
         ]
 
-        mock_email_client.get_folders.side_effect = [
-            initial_folders,
-            initial_folders,
-            refreshed_folders,
-            refreshed_folders,
-        ]
-        mock_email_client.create_folder.return_value = None
+        client = FakeEmailClient(
+            [initial_folders, initial_folders, refreshed_folders, refreshed_folders],
+            created=None,
+        )
 
-        manager = FolderManager(mock_email_client)
+        manager = FolderManager(client)
         manager.initialize()
 
         folder = manager.ensure_category_folder("Subscriptions")
         assert folder is not None
         assert folder.id == "folder-subscriptions"
-        mock_email_client.create_folder.assert_called_once_with("Subscriptions")
+        assert client.create_folder_calls == [("Subscriptions", None)]
 
-    def test_ensure_subcategory_folder(self, mock_email_client, sample_folders):
+    def test_ensure_subcategory_folder(self, fake_client, initialized_manager):
         """Test creating subcategory folder."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
         new_subfolder = Folder(id="folder-sub", displayName="Priority", parentFolderId="folder-2")
-        mock_email_client.create_folder.return_value = new_subfolder
+        fake_client.created = new_subfolder
 
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
-
-        folder = manager.ensure_subcategory_folder("Action", "Priority")
+        folder = initialized_manager.ensure_subcategory_folder("Action", "Priority")
         assert folder is not None
-        mock_email_client.create_folder.assert_called_once_with("Priority", "folder-2")
+        assert fake_client.create_folder_calls == [("Priority", "folder-2")]
 
     def test_ensure_subcategory_folder_handles_conflict_by_refreshing_and_resolving(
-        self, mock_email_client
+        self,
     ) -> None:
         """Treat 409 conflict (create_folder returns None) as OK and resolve existing child."""
 
@@ -247,28 +225,20 @@ class TestFolderManagerCreation:
             ),
         ]
 
-        mock_email_client.get_folders.side_effect = [
-            initial_folders,
-            initial_folders,
-            refreshed_folders,
-            refreshed_folders,
-        ]
-        mock_email_client.create_folder.return_value = None
+        client = FakeEmailClient(
+            [initial_folders, initial_folders, refreshed_folders, refreshed_folders],
+            created=None,
+        )
 
-        manager = FolderManager(mock_email_client)
+        manager = FolderManager(client)
         manager.initialize()
 
         folder = manager.ensure_subcategory_folder("Action", "Subscriptions")
         assert folder is not None
         assert folder.id == "folder-action-subscriptions"
-        mock_email_client.create_folder.assert_called_once_with(
-            "Subscriptions",
-            "folder-action",
-        )
+        assert client.create_folder_calls == [("Subscriptions", "folder-action")]
 
-    def test_ensure_subcategory_folder_prefers_child_over_root_same_name(
-        self, mock_email_client
-    ):
+    def test_ensure_subcategory_folder_prefers_child_over_root_same_name(self):
         """Test subcategory lookup when root-level folder shares the same name.
 
         This guards against cache collisions where a root-level folder named
@@ -284,26 +254,22 @@ class TestFolderManagerCreation:
                 parentFolderId="folder-action",
             ),
         ]
-        mock_email_client.get_folders.side_effect = [folders, folders]
+        client = FakeEmailClient([folders])
 
-        manager = FolderManager(mock_email_client)
+        manager = FolderManager(client)
         manager.initialize()
 
         folder = manager.ensure_subcategory_folder("Action", "Business")
         assert folder is not None
         assert folder.id == "folder-business-child"
-        mock_email_client.create_folder.assert_not_called()
+        assert client.create_folder_calls == []
 
 
 class TestFolderManagerDestination:
     """Tests for destination folder resolution."""
 
-    def test_get_destination_folder_category_only(self, mock_email_client, sample_folders):
+    def test_get_destination_folder_category_only(self, initialized_manager):
         """Test getting destination folder for category only."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
-
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
 
         categorization = CategorizationResult(
             id="email-1",
@@ -313,16 +279,12 @@ class TestFolderManagerDestination:
             analysis="Test",
         )
 
-        folder = manager.get_destination_folder(categorization)
+        folder = initialized_manager.get_destination_folder(categorization)
         assert folder is not None
         assert folder.display_name == "Action"
 
-    def test_get_destination_folder_with_subcategory(self, mock_email_client, sample_folders):
+    def test_get_destination_folder_with_subcategory(self, initialized_manager):
         """Test getting destination folder with subcategory."""
-        mock_email_client.get_folders.side_effect = [sample_folders, sample_folders]
-
-        manager = FolderManager(mock_email_client)
-        manager.initialize()
 
         # Subcategory already exists
         categorization = CategorizationResult(
@@ -333,6 +295,6 @@ class TestFolderManagerDestination:
             analysis="Test",
         )
 
-        folder = manager.get_destination_folder(categorization)
+        folder = initialized_manager.get_destination_folder(categorization)
         assert folder is not None
         assert folder.display_name == "Urgent"
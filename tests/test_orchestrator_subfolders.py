@@ -1,9 +1,17 @@
+from dataclasses import dataclass
 from unittest.mock import MagicMock
 
 from src.outlook_categorizer.orchestrator import EmailOrchestrator
 from src.outlook_categorizer.models import Email, EmailBody
 
 
+@dataclass(frozen=True, slots=True)
+class _Folder:
+    """Minimal stand-in for a folder: the orchestrator only reads .id."""
+
+    id: str
+
+
 def _make_email(email_id: str) -> Email:
     """Create a minimal Email model for orchestrator tests."""
 
@@ -26,14 +34,14 @@ def test_orchestrator_fetches_from_folder_and_subfolders(monkeypatch) -> None:
     # Stub out destination folder setup to keep test focused on fetching.
     orchestrator.folder_manager.initialize = MagicMock()
     orchestrator.folder_manager.resolve_folder_label = MagicMock(
-        return_value=MagicMock(id="root")
+        return_value=_Folder("root")
     )
 
     orchestrator.folder_manager.get_descendant_folders = MagicMock(
         return_value=[
-            MagicMock(id="root"),
-            MagicMock(id="child-1"),
-            MagicMock(id="child-2"),
+            _Folder("root"),
+            _Folder("child-1"),
+            _Folder("child-2"),
         ]
     )
 
@@ -55,11 +63,12 @@ def test_orchestrator_fetches_from_folder_and_subfolders(monkeypatch) -> None:
     assert len(results) == 3
     assert orchestrator.email_client.get_emails.call_count == 3
 
+    # Folder fetches run concurrently, so call order is not guaranteed.
     called_folder_ids = [
         call.kwargs["folder_id"]
         for call in orchestrator.email_client.get_emails.mock_calls
     ]
-    assert called_folder_ids == ["root", "child-1", "child-2"]
+    assert sorted(called_folder_ids) == ["child-1", "child-2", "root"]
 
 
 def test_orchestrator_folder_without_children_only_fetches_once(monkeypatch) -> None:
@@ -73,11 +82,11 @@ def test_orchestrator_folder_without_children_only_fetches_once(monkeypatch) ->
 
     orchestrator.folder_manager.initialize = MagicMock()
     orchestrator.folder_manager.resolve_folder_label = MagicMock(
-        return_value=MagicMock(id="root")
+        return_value=_Folder("root")
     )
 
     orchestrator.folder_manager.get_descendant_folders = MagicMock(
-        return_value=[MagicMock(id="root")]
+        return_value=[_Folder("root")]
     )
 
     orchestrator.email_client.get_emails = MagicMock(return_value=[_make_email("e1")])
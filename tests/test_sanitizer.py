@@ -33,6 +33,13 @@ class TestHtmlToMarkdown:
         assert "alert" not in result
         assert "Content" in result
 
+    def test_removes_blockquotes(self):
+        """Test that quoted reply chains are removed."""
+        html = "<p>New reply</p><blockquote>Older quoted message</blockquote>"
+        result = html_to_markdown(html)
+        assert "Older quoted message" not in result
+        assert "New reply" in result
+
 
 class TestCleanText:
     """Tests for clean_text function."""
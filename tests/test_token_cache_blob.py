@@ -21,7 +21,10 @@ class _FakeBlobClient:
         if not self._exists:
             raise self._ResourceNotFoundError()
 
-        stream = types.SimpleNamespace(readall=lambda: self._data or b"{}")
+        stream = types.SimpleNamespace(
+            readall=lambda: self._data or b"{}",
+            properties=_Props(self._etag),
+        )
         return stream
 
     def get_blob_properties(self):
@@ -29,7 +32,7 @@ class _FakeBlobClient:
             raise self._ResourceNotFoundError()
         return _Props(self._etag)
 
-    def upload_blob(self, data: bytes, overwrite: bool, if_match=None):
+    def upload_blob(self, data: bytes, length=None, overwrite: bool = False, if_match=None):
         if not overwrite and self._exists:
             raise Exception("Already exists")
 
@@ -44,6 +47,7 @@ class _FakeBlobClient:
         self._exists = True
         # bump etag
         self._etag = '"0x2"'
+        return {"etag": self._etag}
 
     class _ResourceNotFoundError(Exception):
         pass
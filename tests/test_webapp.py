@@ -1,3 +1,4 @@
+import pytest
 from unittest.mock import MagicMock
 
 from fastapi.testclient import TestClient
@@ -7,23 +8,39 @@ from src.outlook_categorizer.webapp import create_app, get_orchestrator
 from src.outlook_categorizer.auth import DeviceCodeAuthRequired
 
 
-def test_health() -> None:
-    """Health endpoint returns ok."""
+@pytest.fixture(scope="session")
+def app():
+    """Build the FastAPI app once for the whole test session."""
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """One TestClient (and its transport/portal) shared across tests."""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def orchestrator(app):
+    """Per-test orchestrator mock wired into the shared app via overrides."""
+    orchestrator = MagicMock()
+    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
+    yield orchestrator
+    app.dependency_overrides.clear()
 
-    app = create_app()
-    client = TestClient(app)
+
+def test_health(client) -> None:
+    """Health endpoint returns ok."""
 
     resp = client.get("/health")
     assert resp.status_code == 200
     assert resp.json() == {"status": "ok"}
 
 
-def test_api_run_returns_results_and_summary() -> None:
+def test_api_run_returns_results_and_summary(client, orchestrator) -> None:
     """API run returns results list and summary."""
 
-    app = create_app()
-
-    orchestrator = MagicMock()
     orchestrator.run.return_value = [
         ProcessingResult(
             email_id="e1",
@@ -44,9 +61,6 @@ def test_api_run_returns_results_and_summary() -> None:
         ),
     ]
 
-    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
-
-    client = TestClient(app)
     resp = client.post(
         "/api/run",
         json={"limit": 5, "folder_label": "Inbox/Boss", "dry_run": True},
@@ -68,12 +82,9 @@ def test_api_run_returns_results_and_summary() -> None:
     )
 
 
-def test_run_html_auth_required_renders_device_code_instructions() -> None:
+def test_run_html_auth_required_renders_device_code_instructions(client, orchestrator) -> None:
     """HTML run shows device-code instructions when auth is required."""
 
-    app = create_app()
-
-    orchestrator = MagicMock()
     orchestrator.run.side_effect = DeviceCodeAuthRequired(
         {
             "user_code": "ABCDE12345",
@@ -82,9 +93,6 @@ def test_run_html_auth_required_renders_device_code_instructions() -> None:
         }
     )
 
-    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
-    client = TestClient(app)
-
     resp = client.post(
         "/run",
         data={"limit": "5", "folder_label": "Inbox", "dry_run": "true"},
@@ -96,12 +104,9 @@ def test_run_html_auth_required_renders_device_code_instructions() -> None:
     assert "microsoft.com/link" in resp.text
 
 
-def test_api_run_auth_required_returns_401_payload() -> None:
+def test_api_run_auth_required_returns_401_payload(client, orchestrator) -> None:
     """API run returns a structured 401 JSON when auth is required."""
 
-    app = create_app()
-
-    orchestrator = MagicMock()
     orchestrator.run.side_effect = DeviceCodeAuthRequired(
         {
             "user_code": "ZZZZZ99999",
@@ -110,9 +115,6 @@ def test_api_run_auth_required_returns_401_payload() -> None:
         }
     )
 
-    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
-    client = TestClient(app)
-
     resp = client.post(
         "/api/run",
         json={"limit": 1, "folder_label": "Inbox", "dry_run": True},
@@ -125,11 +127,68 @@ def test_api_run_auth_required_returns_401_payload() -> None:
     assert payload["user_code"] == "ZZZZZ99999"
 
 
-def test_auth_complete_returns_home_page() -> None:
-    """Auth complete endpoint should not 404 and returns the home page."""
+def test_api_run_parses_string_false_dry_run_as_false(client, orchestrator) -> None:
+    """A JSON string "false" must not be coerced to a truthy dry_run."""
+
+    orchestrator.run.return_value = []
+
+    resp = client.post(
+        "/api/run",
+        json={"limit": 1, "folder_label": "Inbox", "dry_run": "false"},
+    )
+
+    assert resp.status_code == 200
+    orchestrator.run.assert_called_once_with(
+        limit=1,
+        folder_label="Inbox",
+        dry_run=False,
+    )
 
-    app = create_app()
-    client = TestClient(app)
+
+def test_api_run_stream_emits_results_and_summary_events(client, orchestrator) -> None:
+    """Streaming run emits one SSE data event per result plus a summary."""
+
+    orchestrator.run_iter.return_value = iter(
+        [
+            ProcessingResult(
+                email_id="e1",
+                subject="Hello",
+                sender="alice@example.com",
+                category="Business",
+                sender_goal="Request information",
+                success=True,
+            ),
+            ProcessingResult(
+                email_id="e2",
+                subject="Oops",
+                sender="bob@example.com",
+                category="Other",
+                sender_goal="",
+                success=False,
+                error="boom",
+            ),
+        ]
+    )
+
+    resp = client.post(
+        "/api/run/stream",
+        json={"limit": 5, "folder_label": "Inbox/Boss", "dry_run": True},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+    events = [block for block in resp.text.split("\n\n") if block]
+    assert len(events) == 3
+    assert '"email_id":"e1"' in events[0]
+    assert '"email_id":"e2"' in events[1]
+    assert events[2].startswith("event: summary")
+    assert '"total":2' in events[2]
+    assert '"successful":1' in events[2]
+
+
+def test_auth_complete_returns_home_page(client) -> None:
+    """Auth complete endpoint should not 404 and returns the home page."""
 
     resp = client.post(
         "/auth/complete",
@@ -140,17 +199,11 @@ def test_auth_complete_returns_home_page() -> None:
     assert "Outlook Email Categorizer" in resp.text
 
 
-def test_run_html_passes_target_user_principal_name() -> None:
+def test_run_html_passes_target_user_principal_name(client, orchestrator) -> None:
     """HTML run passes target_user_principal_name to orchestrator when provided."""
 
-    app = create_app()
-
-    orchestrator = MagicMock()
     orchestrator.run.return_value = []
 
-    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
-    client = TestClient(app)
-
     resp = client.post(
         "/run",
         data={
@@ -170,17 +223,11 @@ def test_run_html_passes_target_user_principal_name() -> None:
     )
 
 
-def test_api_run_passes_target_user_principal_name() -> None:
+def test_api_run_passes_target_user_principal_name(client, orchestrator) -> None:
     """API run passes target_user_principal_name in JSON payload to orchestrator."""
 
-    app = create_app()
-
-    orchestrator = MagicMock()
     orchestrator.run.return_value = []
 
-    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
-    client = TestClient(app)
-
     resp = client.post(
         "/api/run",
         json={